@@ -110,6 +110,8 @@ class SemanticInterface(Interface):
     Methods:
     get_lemmatizing(): calls the lemmatizing method
                        from the backend-module
+    get_tag_lemmatizing(): calls the POS-aware lemmatizing method
+                           from the backend-module
     get_stemming(): calls the stemming method
                     from the backend-module
     get_tags(): calls the tagging method
@@ -134,6 +136,16 @@ class SemanticInterface(Interface):
         """
         return backend.SemanticProcessing.lemmatizing(self.text)
 
+    def get_tag_lemmatizing(self, tags):
+        """
+        This method calls for POS-aware word lemmatizing.
+
+        :param tags(list): a list of paired tuples of token - tag
+                           returned by the 'get_tags' method
+        :return (list): a list of tuples of token - tag - lemmatized word
+        """
+        return backend.SemanticProcessing.tag_lemmatizing(tags)
+
     def get_stemming(self):
         """
         This method calls for word stemming.
@@ -6,6 +6,17 @@ import time
 import nltk
 
 
+# (A precomputed table of Penn Treebank tags mapped to WordNet POS:
+#  'a' - adjective, 'v' - verb, 'n' - noun, 'r' - adverb.
+#  Tags absent from the table are lemmatized as nouns.)
+PENN_TO_WORDNET = {
+    "JJ": "a", "JJR": "a", "JJS": "a",
+    "VB": "v", "VBD": "v", "VBG": "v", "VBN": "v", "VBP": "v", "VBZ": "v",
+    "NN": "n", "NNS": "n", "NNP": "n", "NNPS": "n",
+    "RB": "r", "RBR": "r", "RBS": "r", "WRB": "r",
+}
+
+
 class TokensStopwords:
     """
     This class executes such natural language-processing operations
@@ -77,6 +88,7 @@ class SemanticProcessing:
 
     Methods:
     lemmatizing(): executes lemmatizing of the text
+    tag_lemmatizing(): executes POS-aware lemmatizing of the text
     stemming(): executes stemming of the text
     tagging(): executes tagging of the text
     """
@@ -119,6 +131,45 @@ class SemanticProcessing:
         print(f"LEMMATIZED TOKENS IN TOTAL: {len(lemm_list)}")
         return lemm_dict
 
+    @staticmethod
+    def tag_lemmatizing(tags):
+        """
+        This method lemmatizes tagged tokens of the text
+        according to their parts of speech.
+
+        :param tags:(list)a list of paired tuples of token - tag
+                    returned by the 'tagging' method)
+
+        Introduced variables:
+        lemmatizer(obj): initialized instance
+                         of the 'WordNetLemmatizer' class
+        lemm_cache(dict): pairs of (token, WordNet POS)(key) -
+                          lemmatized word(value)
+        token, tag(str): a token and its Penn Treebank tag
+        key(tuple): a lowered token and its WordNet POS
+        lemm_list(list): the list of paired tagged tokens -
+                         lemmatized words
+
+        :return tag_lemmas(list): a list of tuples of
+                                  token - tag - lemmatized word
+        """
+        lemmatizer = nltk.WordNetLemmatizer()
+        lemm_cache = {}
+        tag_lemmas = []
+        # (Every unique pair of token - POS is lemmatized only once,
+        #  the result is then reused for its repeated occurrences.)
+        for token, tag in tags:
+            key = (token.lower(), PENN_TO_WORDNET.get(tag, "n"))
+            if key not in lemm_cache:
+                lemm_cache[key] = lemmatizer.lemmatize(*key)
+            tag_lemmas.append((token, tag, lemm_cache[key]))
+        lemm_list = [token + " (" + tag + "): " + lemma
+                     for token, tag, lemma in tag_lemmas]
+        print("\n".join(["".join(str(lemm_list[i:i + 10]))
+                         for i in range(0, len(lemm_list), 10)]))
+        print(f"TAG-LEMMATIZED TOKENS IN TOTAL: {len(lemm_list)}")
+        return tag_lemmas
+
     @staticmethod
     def stemming(text):
         """
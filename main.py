@@ -126,7 +126,10 @@ def run():
             semantics.get_stemming()
             time.sleep(1)
             print("\nTAGGING:")
-            semantics.get_tags()
+            tags = semantics.get_tags()
+            time.sleep(1)
+            print("\nLEMMATIZING BY TAGS:")
+            semantics.get_tag_lemmatizing(tags)
             time.sleep(1)
         elif args.operation == 3:
             print("\nCLASSIFICATION:")